@@ -5,36 +5,121 @@
 import sys
 import math
 import random
+import itertools
 
-# Function to calculate factorial
+# Function to calculate factorial (math.factorial runs in C, no recursion)
 def factorial(n):
-    if n == 0 or n == 1:
-        return 1
-    else:
-        return n * factorial(n - 1)
+    try:
+        return math.factorial(n)
+    except TypeError:
+        # math.factorial rejects floats; keep accepting whole ones like 5.0
+        if isinstance(n, float) and n.is_integer():
+            # 170! is the largest factorial a float can hold
+            if n > 170:
+                return math.inf
+            return float(math.factorial(int(n)))
+        raise
 
 # Function to check if a number is prime
 def is_prime(num):
     if num <= 1:
         return False
-    for i in range(2, int(math.sqrt(num)) + 1):
-        if num % i == 0:
-            return False
+    for p in (2, 3, 5):
+        if num % p == 0:
+            return num == p
+    try:
+        limit = math.isqrt(num)
+    except TypeError:
+        # math.isqrt rejects floats; keep accepting whole ones like 17.0
+        if isinstance(num, float) and num.is_integer():
+            limit = math.isqrt(int(num))
+        else:
+            raise
+    # 2-3-5 wheel: only try divisors that are coprime to 30
+    for base in range(0, limit + 1, 30):
+        for offset in (7, 11, 13, 17, 19, 23, 29, 31):
+            d = base + offset
+            if d > limit:
+                return True
+            if num % d == 0:
+                return False
     return True
 
+# Helper: Sieve of Eratosthenes as a bytearray, sieve[i] == 1 iff i is prime
+def _sieve(n):
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = 0
+    if n >= 1:
+        sieve[1] = 0
+    for p in range(2, math.isqrt(n) + 1):
+        if sieve[p]:
+            # Slice assignment clears every multiple in one C-level store
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return sieve
+
+# Function to list all primes up to n
+def primes_up_to(n):
+    if n < 2:
+        return []
+    # compress() picks out the flagged indices in C, not a Python loop
+    return list(itertools.compress(range(n + 1), _sieve(n)))
+
+# Sieve shared by is_prime_array, grown on demand up to _PRIME_SIEVE_LIMIT
+# (one byte per number, so about 10 MB at most)
+_PRIME_SIEVE_LIMIT = 10**7
+_prime_sieve = bytearray(2)
+
+# Function to check many numbers at once against the cached sieve
+def is_prime_array(numbers):
+    global _prime_sieve
+    numbers = list(numbers)
+    top = min(max(numbers, default=0), _PRIME_SIEVE_LIMIT)
+    if top >= len(_prime_sieve):
+        # Grow at least 2x so a run of rising queries re-sieves rarely
+        size = max(top, 2 * len(_prime_sieve))
+        _prime_sieve = _sieve(min(int(size), _PRIME_SIEVE_LIMIT))
+    sieve = _prime_sieve
+    size = len(sieve)
+    try:
+        # Numbers past the cap fall back to trial division
+        return [n > 1 and (sieve[n] == 1 if n < size else is_prime(n))
+                for n in numbers]
+    except TypeError:
+        # Floats can't index the sieve; keep accepting whole ones like 7.0
+        if not any(isinstance(n, float) and n.is_integer() for n in numbers):
+            raise
+        return is_prime_array(
+            [int(n) if isinstance(n, float) and n.is_integer() else n
+             for n in numbers])
+
 # Function to generate Fibonacci sequence
 def fibonacci_sequence(length):
-    fib = [0, 1]
+    # Preallocate the list and fill by index instead of growing it;
+    # the last two values live in locals rather than being read back
+    fib = [0, 1] + [0] * (length - 2)
+    a, b = 0, 1
     for i in range(2, length):
-        fib.append(fib[-1] + fib[-2])
+        a, b = b, a + b
+        fib[i] = b
     return fib
 
+# Function to get the nth Fibonacci number by fast doubling, O(log n) steps
+def fibonacci_nth(n):
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = 0, 1  # F(k), F(k + 1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k + 1)
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a
+
 # Function to print a greeting
 def greet(name):
     print(f"Hello, {name}!")
 
-# Main execution starts here
-if __name__ == "__main__":
+# Demo body, kept in a function so its names are fast locals
+def _run_demo():
     # Print a header
     print("Welcome to this Python demo script!")
     
@@ -43,6 +128,8 @@ if __name__ == "__main__":
     
     # Example of prime check
     print("Is 17 prime?", is_prime(17))
+    print("Primes up to 30:", primes_up_to(30))
+    print("Which of 7, 9, 11 are prime?", is_prime_array([7, 9, 11]))
     
     # Generate and print Fibonacci sequence
     fib_seq = fibonacci_sequence(10)
@@ -201,9 +288,8 @@ if __name__ == "__main__":
     evens = list(filter(lambda x: x % 2 == 0, numbers))
     print("Even numbers:", evens)
     
-    # Reduce simulation (using functools)
-    from functools import reduce
-    product = reduce(lambda x, y: x * y, numbers)
+    # Product of a list (math.prod multiplies in C, no lambda per element)
+    product = math.prod(numbers)
     print("Product:", product)
     
     # Context manager simulation
@@ -238,4 +324,8 @@ if __name__ == "__main__":
     
     # End of script
     print("Script execution completed.")
-    
\ No newline at end of file
+
+
+# Main execution starts here
+if __name__ == "__main__":
+    _run_demo()